@@ -1,59 +1,116 @@
 """Database models for schema storage"""
 
 import os
-import stat
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
 from sqlalchemy import (
     JSON,
+    BigInteger,
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
+    CheckConstraint,
+    SmallInteger,
     String,
+    Text,
+    bindparam,
     create_engine,
+    event,
     func,
+    insert,
+    inspect,
+    lambda_stmt,
+    make_url,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
 )
-from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import (
+    DeclarativeBase,
     Mapped,
     Session,
     mapped_column,
+    raiseload,
     relationship,
+    selectinload,
     sessionmaker,
 )
+from sqlalchemy.pool import StaticPool
 
 from .loggers import get_logger
 from .settings import settings
 
 logger = get_logger(__name__)
-Base = declarative_base()
+
+
+class Base(DeclarativeBase):
+    """Declarative base for all models"""
+
+
+# JSONB on Postgres stores parsed binary (no re-tokenizing on read) and
+# unlocks containment/GIN indexing; SQLite keeps the plain JSON affinity
+_JSON_VARIANT = JSON().with_variant(JSONB(), 'postgresql')
+
+# 64-bit ids for the append-only generations log so it never needs a
+# rewriting type migration; SQLite keeps INTEGER for rowid autoincrement
+_BIGINT_VARIANT = BigInteger().with_variant(Integer(), 'sqlite')
 
 # Module-level flag to track initialization
 _DB_INITIALIZED = False
 
+# Engine and sessionmaker are expensive to build (dialect, pool, compiled
+# statement cache) - create them once and reuse
+_engine: Engine | None = None
+_SessionLocal: sessionmaker | None = None
+_async_engine: AsyncEngine | None = None
+_AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
 
 class Schema(Base):
     """A schema with version tracking"""
 
     __tablename__ = 'schemas'
+    # mirror of the migration's name bound; length() also runs on SQLite
+    __table_args__ = (
+        CheckConstraint('length(name) <= 255', name='ck_schemas_name_len'),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    name: Mapped[str] = mapped_column(String, nullable=False)
-    description: Mapped[str] = mapped_column(String)
-    prompt: Mapped[str] = mapped_column(String)
-    fields: Mapped[list[dict[str, Any]]] = mapped_column(JSON, nullable=False)
-    version: Mapped[int] = mapped_column(Integer, nullable=False)
+    # bounded so the most-scanned column stays off overflow pages; names
+    # are not unique across versions (see the partial index below)
+    name: Mapped[str] = mapped_column(String(255), nullable=False)
+    description: Mapped[str] = mapped_column(Text)
+    prompt: Mapped[str] = mapped_column(Text)
+    # deferred: list/lookup paths skip the JSON decode unless a caller
+    # opts in with undefer(Schema.fields)
+    fields: Mapped[list[dict[str, Any]]] = mapped_column(
+        _JSON_VARIANT, nullable=False, deferred=True
+    )
+    # smallint: versions never approach 32k and the narrower column
+    # tightens row width on the most-scanned table
+    version: Mapped[int] = mapped_column(SmallInteger, nullable=False)
     is_builtin: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now()
+        DateTime(timezone=True), server_default=func.now()
     )
 
-    # Self-referential relationship for versioning
+    # Self-referential relationship for versioning; cascading lets a
+    # bulk DELETE of all versions succeed regardless of row order
     parent_id: Mapped[int | None] = mapped_column(
-        ForeignKey('schemas.id'), nullable=True
+        ForeignKey('schemas.id', ondelete='CASCADE'), nullable=True
     )
     parent: Mapped['Schema | None'] = relationship(
         'Schema',
@@ -65,9 +122,19 @@ class Schema(Base):
     # Track the latest version for each schema name
     is_latest: Mapped[bool] = mapped_column(Boolean, default=True)
 
-    # generations relationship
+    # Denormalized count of generations, maintained on flush, so listings
+    # never need a COUNT(*) aggregate per schema
+    generation_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default='0', nullable=False
+    )
+
+    # generations relationship; passive_deletes defers to the FK's
+    # ON DELETE CASCADE instead of loading children just to delete them
     generations: Mapped[list['Generation']] = relationship(
-        'Generation', back_populates='schema', cascade='all, delete-orphan'
+        'Generation',
+        back_populates='schema',
+        cascade='all, delete-orphan',
+        passive_deletes=True,
     )
 
 
@@ -76,14 +143,17 @@ class Generation(Base):
 
     __tablename__ = 'generations'
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    id: Mapped[int] = mapped_column(_BIGINT_VARIANT, primary_key=True)
     schema_id: Mapped[int] = mapped_column(
-        ForeignKey('schemas.id'), nullable=False
+        ForeignKey('schemas.id', ondelete='CASCADE'), nullable=False
+    )
+    prompt: Mapped[str] = mapped_column(Text, nullable=False)
+    # deferred for the same reason as Schema.fields
+    output: Mapped[dict[str, Any]] = mapped_column(
+        _JSON_VARIANT, nullable=False, deferred=True
     )
-    prompt: Mapped[str] = mapped_column(String, nullable=False)
-    output: Mapped[dict[str, Any]] = mapped_column(JSON, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, server_default=func.now()
+        DateTime(timezone=True), server_default=func.now()
     )
     is_favorite: Mapped[bool] = mapped_column(Boolean, default=False)
 
@@ -91,51 +161,248 @@ class Generation(Base):
     schema: Mapped[Schema] = relationship(back_populates='generations')
 
 
+# Hot-path indexes: "latest schema by name" and "recent generations for a
+# schema". The partial unique index also enforces one latest row per name.
+Index('ix_schemas_name_latest', Schema.name, Schema.is_latest)
+Index(
+    'ix_schemas_name_is_latest_unique',
+    Schema.name,
+    unique=True,
+    sqlite_where=text('is_latest = 1'),
+    postgresql_where=text('is_latest'),
+)
+Index(
+    'ix_generations_schema_created',
+    Generation.schema_id,
+    Generation.created_at.desc(),
+)
+# "latest by name" can resolve as an index-only scan over (name, version)
+Index('ix_schemas_name_version', Schema.name, Schema.version)
+# self-referential FK gets no index implicitly; version-chain walks and
+# cascading deletes need one
+Index('ix_schemas_parent_id', Schema.parent_id)
+# favorites filtering touches only the (small) favorited subset
+Index(
+    'ix_generations_favorite',
+    Generation.schema_id,
+    Generation.created_at,
+    sqlite_where=text('is_favorite = 1'),
+    postgresql_where=text('is_favorite'),
+)
+
+
+@event.listens_for(Session, 'before_flush')
+def _maintain_generation_counts(session, _flush_context, _instances) -> None:
+    """Keep Schema.generation_count in sync with pending inserts/deletes"""
+    deltas: dict[int, int] = {}
+    for obj in session.new:
+        if isinstance(obj, Generation) and obj.schema_id is not None:
+            deltas[obj.schema_id] = deltas.get(obj.schema_id, 0) + 1
+    for obj in session.deleted:
+        if isinstance(obj, Generation) and obj.schema_id is not None:
+            deltas[obj.schema_id] = deltas.get(obj.schema_id, 0) - 1
+    for schema_id, delta in deltas.items():
+        session.execute(
+            update(Schema)
+            .where(Schema.id == schema_id)
+            .values(generation_count=Schema.generation_count + delta)
+        )
+
+
 def ensure_db_permissions():
     """Ensure database directory and file have correct permissions"""
     db_path = Path(settings.database_url.replace('sqlite:///', ''))
 
-    # Ensure parent directory exists with correct permissions
-    db_dir = db_path.parent
-    db_dir.mkdir(parents=True, exist_ok=True)
-
-    # Set directory permissions to 755 (rwxr-xr-x)
-    os.chmod(
-        db_dir,
-        stat.S_IRWXU
-        | stat.S_IRGRP
-        | stat.S_IXGRP
-        | stat.S_IROTH
-        | stat.S_IXOTH,
-    )
+    # mkdir applies the mode on creation, so no separate chmod is needed
+    # for the directory (755 rwxr-xr-x)
+    db_path.parent.mkdir(mode=0o755, parents=True, exist_ok=True)
 
-    # If database file exists, ensure it has correct permissions (666 rw-rw-rw-)
-    if db_path.exists():
-        os.chmod(
-            db_path,
-            stat.S_IRUSR
-            | stat.S_IWUSR
-            | stat.S_IRGRP
-            | stat.S_IWGRP
-            | stat.S_IROTH
-            | stat.S_IWOTH,
-        )
+    # chmod the file to 666 (rw-rw-rw-) if it exists; try/except saves
+    # the exists() stat call
+    try:
+        os.chmod(db_path, 0o666)
+    except FileNotFoundError:
+        pass
 
     logger.debug(
         f'Database permissions set for {db_path}'
     )  # Changed to debug level
 
 
-def get_engine(db_url: str = settings.database_url):
-    """Get database engine"""
-    return create_engine(db_url)
+def get_schema_by_id(session: Session, schema_id: int) -> Schema | None:
+    """Load a schema by primary key.
+
+    `Session.get` short-circuits to the identity map and uses the
+    precompiled by-PK statement instead of compiling a fresh SELECT.
+    """
+    return session.get(Schema, schema_id)
+
+
+def get_schema_by_name(session: Session, name: str) -> Schema | None:
+    """Load the latest version of a schema by name.
+
+    `lambda_stmt` caches the compiled SQL by the lambda's closure
+    identity, so repeated calls skip the clause-tree walk entirely.
+    """
+    stmt = lambda_stmt(
+        lambda: select(Schema).where(
+            Schema.name == bindparam('name'), Schema.is_latest
+        )
+    )
+    return session.scalars(stmt, {'name': name}).first()
+
+
+def list_schemas_with_children(session: Session) -> list[Schema]:
+    """Load all schemas with generations and versions in batched queries.
+
+    `selectinload` replaces the per-parent lazy SELECTs with one IN-query
+    per relationship; `raiseload('*')` makes any other lazy access fail
+    loudly instead of silently reintroducing N+1.
+    """
+    stmt = select(Schema).options(
+        selectinload(Schema.generations),
+        selectinload(Schema.versions),
+        raiseload('*'),
+    )
+    return list(session.scalars(stmt).unique())
+
+
+def bulk_insert_generations(
+    session: Session, rows: list[dict[str, Any]]
+) -> None:
+    """Insert many generations in one batched statement.
+
+    Callers pass plain dicts of `Generation` columns; this uses the
+    `insertmanyvalues` path instead of one INSERT per ORM instance.
+    """
+    if not rows:
+        return
+    session.execute(insert(Generation), rows)
+    # Core inserts bypass the before_flush counter hook, so bump the
+    # denormalized counts here
+    counts: dict[int, int] = {}
+    for row in rows:
+        counts[row['schema_id']] = counts.get(row['schema_id'], 0) + 1
+    for schema_id, delta in counts.items():
+        session.execute(
+            update(Schema)
+            .where(Schema.id == schema_id)
+            .values(generation_count=Schema.generation_count + delta)
+        )
+    session.commit()
+
+
+def _json_dumps(value: Any) -> str:
+    """orjson-backed serializer for JSON columns"""
+    return orjson.dumps(value).decode()
+
+
+def _set_sqlite_pragmas(dbapi_conn, _) -> None:
+    """Tune each new SQLite connection for concurrent reads + fast writes"""
+    cursor = dbapi_conn.cursor()
+    # WAL allows readers during writes; NORMAL sync drops the per-commit
+    # fsync that WAL makes safe to skip
+    # SQLite ignores FK actions (our ON DELETE CASCADE) unless enabled
+    cursor.execute('PRAGMA foreign_keys=ON')
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA mmap_size=268435456')
+    cursor.execute('PRAGMA cache_size=-65536')
+    cursor.close()
+
+
+def _engine_kwargs(db_url: str) -> dict[str, Any]:
+    """Dialect-appropriate engine/pool settings for db_url.
+
+    SQLite in-memory databases exist per-connection, so they share one
+    connection via StaticPool; file-backed SQLite keeps the default pool
+    with cross-thread connections allowed; server databases get a sized
+    QueuePool with pre-ping.
+    """
+    kwargs: dict[str, Any] = dict(
+        insertmanyvalues_page_size=10_000,
+        json_serializer=_json_dumps,
+        json_deserializer=orjson.loads,
+    )
+    url = make_url(db_url)
+    if url.get_backend_name() == 'sqlite':
+        if url.database in (None, '', ':memory:'):
+            kwargs.update(
+                poolclass=StaticPool,
+                connect_args={'check_same_thread': False},
+            )
+        else:
+            kwargs.update(connect_args={'check_same_thread': False})
+    else:
+        kwargs.update(
+            pool_size=20,
+            max_overflow=10,
+            pool_pre_ping=True,
+            # recycle connections hourly so server-side idle timeouts
+            # never hand us a dead connection mid-request
+            pool_recycle=3600,
+        )
+    return kwargs
+
+
+def get_engine(db_url: str = settings.database_url) -> Engine:
+    """Get the shared database engine, creating it on first use"""
+    global _engine
+    if _engine is None:
+        _engine = create_engine(
+            db_url, future=True, **_engine_kwargs(db_url)
+        )
+        if _engine.dialect.name == 'sqlite':
+            event.listens_for(_engine, 'connect')(_set_sqlite_pragmas)
+    return _engine
 
 
 def get_session() -> Session:
-    """Get database session"""
-    engine = get_engine()
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-    return SessionLocal()
+    """Get database session from the shared sessionmaker"""
+    global _SessionLocal
+    if _SessionLocal is None:
+        _SessionLocal = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=get_engine(),
+        )
+    return _SessionLocal()
+
+
+def _async_db_url(db_url: str) -> str:
+    """Map a sync database URL to its async driver equivalent"""
+    if db_url.startswith('sqlite:///'):
+        return db_url.replace('sqlite:///', 'sqlite+aiosqlite:///', 1)
+    if db_url.startswith('postgresql://'):
+        return db_url.replace('postgresql://', 'postgresql+asyncpg://', 1)
+    return db_url
+
+
+def get_async_engine(db_url: str = settings.database_url) -> AsyncEngine:
+    """Get the shared async engine, creating it on first use"""
+    global _async_engine
+    if _async_engine is None:
+        async_url = _async_db_url(db_url)
+        _async_engine = create_async_engine(
+            async_url, **_engine_kwargs(async_url)
+        )
+        if _async_engine.dialect.name == 'sqlite':
+            event.listens_for(_async_engine.sync_engine, 'connect')(
+                _set_sqlite_pragmas
+            )
+    return _async_engine
+
+
+def get_async_session() -> AsyncSession:
+    """Get an async database session; query I/O yields to the event loop"""
+    global _AsyncSessionLocal
+    if _AsyncSessionLocal is None:
+        _AsyncSessionLocal = async_sessionmaker(
+            get_async_engine(), expire_on_commit=False
+        )
+    return _AsyncSessionLocal()
 
 
 def init_db() -> None:
@@ -149,7 +416,19 @@ def init_db() -> None:
     ensure_db_permissions()
 
     engine = get_engine()
-    Base.metadata.create_all(bind=engine)
+    # one inspection round-trip instead of a per-table existence probe
+    with engine.connect() as conn:
+        existing = set(inspect(conn).get_table_names())
+        missing = [
+            table
+            for table in Base.metadata.tables.values()
+            if table.name not in existing
+        ]
+        if missing:
+            Base.metadata.create_all(
+                bind=conn, tables=missing, checkfirst=False
+            )
+            conn.commit()
 
     _DB_INITIALIZED = True
     logger.info('Database initialized')
@@ -4,14 +4,20 @@ Logging configuration.
 """
 
 import logging
-from functools import lru_cache
 
 from rich.console import Console
 from rich.logging import RichHandler
 
 
+_CONFIGURED = False
+
+
 def configure_logging() -> None:
-    """Configure rich logging with console handler."""
+    """Configure rich logging with console handler (one-shot)."""
+    global _CONFIGURED
+    if _CONFIGURED:
+        return
+
     logger = logging.getLogger('marvin')
 
     if not logger.handlers:  # only add handler if none exists
@@ -26,8 +32,31 @@ def configure_logging() -> None:
         logger.addHandler(handler)
         logger.setLevel(logging.INFO)  # this will be overridden by settings
 
+    _CONFIGURED = True
+
+
+# plain dict memo - lru_cache adds hashing + lock overhead per call and
+# the set of logger names is small
+_LOGGER_CACHE: dict[str | None, logging.Logger] = {}
+
+
+def _build_logger(name: str | None) -> logging.Logger:
+    """Build the (possibly child) logger for the given name"""
+    parent_logger = logging.getLogger('marvin')
+
+    if name:
+        # Append the name if given but allow explicit full names e.g. "marvin.test"
+        # should not become "marvin.marvin.test"
+        if not name.startswith(parent_logger.name + '.'):
+            logger = parent_logger.getChild(name)
+        else:
+            logger = logging.getLogger(name)
+    else:
+        logger = parent_logger
+
+    return logger
+
 
-@lru_cache
 def get_logger(name: str | None = None) -> logging.Logger:
     """Retrieves a logger with the given name, or the root logger if no name is given.
 
@@ -49,19 +78,11 @@ def get_logger(name: str | None = None) -> logging.Logger:
         debug_logger.debug_kv("TITLE", "log message", "green")
         ```
     """
-    # ensure logging is configured
-    configure_logging()
+    logger = _LOGGER_CACHE.get(name)
+    if logger is None:
+        logger = _LOGGER_CACHE[name] = _build_logger(name)
+    return logger
 
-    parent_logger = logging.getLogger('marvin')
 
-    if name:
-        # Append the name if given but allow explicit full names e.g. "marvin.test"
-        # should not become "marvin.marvin.test"
-        if not name.startswith(parent_logger.name + '.'):
-            logger = parent_logger.getChild(name)
-        else:
-            logger = logging.getLogger(name)
-    else:
-        logger = parent_logger
-
-    return logger
+# configure once at import rather than on every logger fetch
+configure_logging()
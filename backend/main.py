@@ -1,21 +1,41 @@
 """Main backend module"""
 
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from functools import lru_cache
+from itertools import groupby
 from typing import Any, Literal
 
 import marvin
-from fastapi import Depends, FastAPI, HTTPException, Request
+import orjson
+from fastapi import (
+    Depends,
+    FastAPI,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import (
+    JSONResponse,
+    ORJSONResponse,
+    StreamingResponse,
+)
 from pydantic import BaseModel, ConfigDict, Field, create_model
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, raiseload, selectinload, undefer
 
 from . import VERSION
-from .database import Generation, Schema, get_session, init_db
+from .database import Generation, Schema, get_async_session, init_db
 from .loggers import get_logger
-from .schemas import SchemaDefinition, SchemaService, schema_service
+from .schemas import SchemaDefinition, SchemaService, get_schema_service
 
 logger = get_logger(__name__)
 
@@ -37,6 +57,8 @@ class ErrorResponse(BaseModel):
 class PromptRequest(BaseModel):
     """Prompt request"""
 
+    model_config = ConfigDict(defer_build=True)
+
     prompt: str
 
 
@@ -51,20 +73,118 @@ class GenerationResponse(BaseModel):
     created_at: str
     is_favorite: bool
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
+
+# NewSchema batching: concurrent prompts within a short window are
+# coalesced into a single LLM call instead of one API call per request
+_NEW_SCHEMA_INSTRUCTIONS = (
+    'the prompt should be short and give a user an understanding of what text they need to provide. '
+    'note that the user does not need to provide all fields, they can give a fuzzy description. '
+    'for fields, return a list of SchemaField objects with name, type, and description. '
+    'type must be one of: string, integer, boolean, number, list, dict. '
+    'ensure each field has a clear, concise description.'
+)
+_BATCH_MAX_SIZE = 8
+_BATCH_MAX_WAIT = 0.05
+
+_new_schema_queue: (
+    asyncio.Queue[tuple[str, asyncio.Future[SchemaDefinition]]] | None
+) = None
+
+
+async def _new_schema_batcher(
+    queue: asyncio.Queue[tuple[str, asyncio.Future[SchemaDefinition]]],
+) -> None:
+    """Drain queued NewSchema prompts and resolve them in batched calls"""
+    while True:
+        batch = [await queue.get()]
+        deadline = time.monotonic() + _BATCH_MAX_WAIT
+        while len(batch) < _BATCH_MAX_SIZE:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(queue.get(), remaining))
+            except TimeoutError:
+                break
+
+        try:
+            if len(batch) == 1:
+                results = [
+                    await marvin.cast_async(
+                        batch[0][0],
+                        target=SchemaDefinition,
+                        instructions=_NEW_SCHEMA_INSTRUCTIONS,
+                    )
+                ]
+            else:
+                results = await marvin.cast_async(
+                    [prompt for prompt, _ in batch],
+                    target=list[SchemaDefinition],
+                    instructions=(
+                        _NEW_SCHEMA_INSTRUCTIONS
+                        + ' return one schema per input prompt, in order.'
+                    ),
+                )
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f'batched cast returned {len(results)} schemas '
+                    f'for {len(batch)} prompts'
+                )
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+
+async def _cast_new_schema(prompt: str) -> SchemaDefinition:
+    """Cast a prompt to a SchemaDefinition via the batcher.
+
+    Falls back to a direct call when the batcher is not running (e.g.
+    outside the app lifespan, as in tests).
+    """
+    if _new_schema_queue is None:
+        return await marvin.cast_async(
+            prompt,
+            target=SchemaDefinition,
+            instructions=_NEW_SCHEMA_INSTRUCTIONS,
+        )
+    future: asyncio.Future[SchemaDefinition] = (
+        asyncio.get_running_loop().create_future()
+    )
+    await _new_schema_queue.put((prompt, future))
+    return await future
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Lifespan context manager for FastAPI app"""
+    global _new_schema_queue
+
+    service = get_schema_service()
     try:
         # Initialize database and builtin schemas
         init_db()
-        schema_service._init_builtins()  # type: ignore
+        service._init_builtins()  # type: ignore
         logger.info('Database and builtin schemas initialized')
     except Exception as e:
-        logger.error(f'Failed to initialize database: {e}')
-    yield
+        logger.error('Failed to initialize database: %s', e)
+
+    # attach the singleton to app.state so endpoints read it directly
+    # instead of going through the Depends machinery
+    app.state.schema_service = service
+
+    _new_schema_queue = asyncio.Queue()
+    batcher = asyncio.create_task(_new_schema_batcher(_new_schema_queue))
+    try:
+        yield
+    finally:
+        _new_schema_queue = None
+        batcher.cancel()
 
 
 app = FastAPI(
@@ -72,6 +192,7 @@ app = FastAPI(
     description='Generate structured outputs from natural language prompts',
     version=VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 app.add_middleware(
@@ -83,6 +204,28 @@ app.add_middleware(
 )
 
 
+@app.middleware('http')
+async def catch_unhandled_exceptions(request: Request, call_next) -> Response:
+    """Map any unhandled exception to a structured 500 response.
+
+    Centralizing here keeps per-endpoint code free of broad
+    try/except wrappers; sessions roll back on teardown in get_db.
+    """
+    try:
+        return await call_next(request)
+    except Exception:
+        logger.exception(
+            'unhandled error for %s %s', request.method, request.url.path
+        )
+        return ORJSONResponse(
+            status_code=500,
+            content=ErrorResponse(
+                type='generation_error',
+                message='Internal server error',
+            ).model_dump(),
+        )
+
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(
     request: Request, exc: RequestValidationError
@@ -114,203 +257,271 @@ async def http_exception_handler(
     )
 
 
-def get_schema_service() -> SchemaService:
-    """Get schema service instance"""
-    return schema_service
+# short-TTL cache for schema reads; entries are keyed on the service's
+# cache_version so writes invalidate immediately
+_SCHEMAS_CACHE_TTL = 5.0
+_schemas_cache: dict[tuple[str, int], tuple[float, Any]] = {}
+
+
+# LRU of generate outputs keyed on (schema name, schema version,
+# prompt): repeated prompts skip the LLM round trip entirely, and
+# schema updates bump the version so stale entries are never hit
+_GENERATE_CACHE_MAX = 1024
+_generate_cache: OrderedDict[tuple[str, int, str], dict[str, Any]] = (
+    OrderedDict()
+)
+
+
+# hoisted so the dispatch table isn't rebuilt per field; list/dict get
+# concrete generics so pydantic-core compiles a stable schema
+_FIELD_TYPES: dict[str, type] = {
+    'string': str,
+    'integer': int,
+    'boolean': bool,
+    'number': float,
+    'list': list[Any],
+    'dict': dict[str, Any],
+}
+
+
+def _schemas_cache_get(key: tuple[str, int]) -> Any | None:
+    """Return a cached schema payload if present and fresh"""
+    entry = _schemas_cache.get(key)
+    if entry and time.monotonic() - entry[0] < _SCHEMAS_CACHE_TTL:
+        return entry[1]
+    return None
 
 
-def get_db():
+def _schemas_cache_put(key: tuple[str, int], value: Any) -> None:
+    """Cache a schema payload, dropping stale-version entries"""
+    for stale in [k for k in _schemas_cache if k[1] != key[1]]:
+        del _schemas_cache[stale]
+    _schemas_cache[key] = (time.monotonic(), value)
+
+
+async def get_db() -> AsyncGenerator[AsyncSession, None]:
     """Get database session"""
-    db = get_session()
-    try:
+    async with get_async_session() as db:
         yield db
-    finally:
-        db.close()
 
 
-def create_pydantic_model(schema: SchemaDefinition) -> type[BaseModel]:
-    """Create a Pydantic model from a schema definition"""
-    fields: dict[str, Any] = {}
-    for field in schema.fields:
-        python_type = {
-            'string': str,
-            'integer': int,
-            'boolean': bool,
-            'number': float,
-            'list': list,
-            'dict': dict,
-        }.get(field.type, str)
-
-        fields[field.name] = (python_type, Field(description=field.description))
+@lru_cache(maxsize=256)
+def _build_model(
+    name: str, fields_key: tuple[tuple[str, str, str], ...]
+) -> type[BaseModel]:
+    """Build the Pydantic model for a schema, cached by (name, fields).
 
+    create_model compiles a fresh pydantic-core schema each call, so the
+    result is reused until the schema's fields actually change.
+    """
+    fields: dict[str, Any] = {
+        field_name: (
+            _FIELD_TYPES.get(field_type, str),
+            Field(description=field_description),
+        )
+        for field_name, field_type, field_description in fields_key
+    }
     return create_model(
-        schema.name, **fields, __config__=ConfigDict(title=schema.name)
+        name,
+        **fields,
+        __config__=ConfigDict(title=name, defer_build=True),
+    )
+
+
+def _generation_dict(gen: Generation, schema_name: str) -> dict[str, Any]:
+    """Serialize a generation row straight to a dict for ORJSONResponse.
+
+    List endpoints were building GenerationResponse objects only for
+    FastAPI to re-serialize them; rows from our own DB can go out as-is.
+    """
+    return {
+        'id': gen.id,
+        'schema_name': schema_name,
+        'schema_version': gen.schema.version,
+        'prompt': gen.prompt,
+        'output': gen.output,
+        'created_at': gen.created_at.isoformat(),
+        'is_favorite': gen.is_favorite,
+    }
+
+
+def create_pydantic_model(schema: SchemaDefinition) -> type[BaseModel]:
+    """Create a Pydantic model from a schema definition"""
+    fields_key = tuple(
+        (field.name, field.type, field.description)
+        for field in schema.fields
     )
+    return _build_model(schema.name, fields_key)
 
 
 @app.get('/schemas')
-def get_schemas(
-    service: SchemaService = Depends(get_schema_service),
-    db: Session = Depends(get_db),
-) -> dict[str, dict[str, Any]]:
+async def get_schemas(
+    request: Request,
+    db: AsyncSession = Depends(get_db),
+) -> Response:
     """Get all schemas"""
-    schemas = service.get_all(db)
-    return {
-        name: {
-            'title': schema.name,
-            'description': schema.description,
-            'prompt': schema.prompt,
-            'is_builtin': schema.is_builtin,
-            'properties': {
-                field.name: {
-                    'type': field.type,
-                    'description': field.description,
-                }
-                for field in schema.fields
-            },
+    service: SchemaService = request.app.state.schema_service
+    cache_key = ('__all__', service.cache_version)
+    if (cached := _schemas_cache_get(cache_key)) is None:
+        schemas = await service.get_all(db)
+        payload = {
+            name: {
+                'title': schema.name,
+                'description': schema.description,
+                'prompt': schema.prompt,
+                'is_builtin': schema.is_builtin,
+                'properties': {
+                    field.name: {
+                        'type': field.type,
+                        'description': field.description,
+                    }
+                    for field in schema.fields
+                },
+            }
+            for name, schema in schemas.items()
         }
-        for name, schema in schemas.items()
-    }
+        # serialize once; warm responses are a bytes copy + ETag compare
+        body = orjson.dumps(payload)
+        cached = (f'"{hashlib.md5(body).hexdigest()}"', body)
+        _schemas_cache_put(cache_key, cached)
+
+    etag, body = cached
+    if request.headers.get('if-none-match') == etag:
+        return Response(status_code=304, headers={'ETag': etag})
+    return Response(
+        body, media_type='application/json', headers={'ETag': etag}
+    )
 
 
 @app.post('/generate/{schema_name}')
 async def generate_structured_output(
     schema_name: str,
     request: PromptRequest,
-    service: SchemaService = Depends(get_schema_service),
-    db: Session = Depends(get_db),
+    http_request: Request,
+    db: AsyncSession = Depends(get_db),
 ) -> dict[str, Any]:
     """Generate structured output from a prompt"""
-    try:
-        # Ensure database is initialized
-        init_db()
-
-        if not (schema := service.get(schema_name, db)):
-            raise HTTPException(
-                status_code=404,
-                detail=f'Schema {schema_name} not found',
-                headers={'X-Error-Type': 'not_found'},
-            )
-
-        try:
-            if schema_name == 'NewSchema':
-                result = await marvin.cast_async(
-                    request.prompt,
-                    target=SchemaDefinition,
-                    instructions=(
-                        'the prompt should be short and give a user an understanding of what text they need to provide. '
-                        'note that the user does not need to provide all fields, they can give a fuzzy description. '
-                        'for fields, return a list of SchemaField objects with name, type, and description. '
-                        'type must be one of: string, integer, boolean, number, list, dict. '
-                        'ensure each field has a clear, concise description.'
-                    ),
-                )
-                service.create(result, db)
-                output = result.model_dump()
-            else:
-                model = create_pydantic_model(schema)
-                result = await marvin.cast_async(request.prompt, target=model)
-                output = result.model_dump()
-
-            try:
-                # Store the generation in the database
-                db_schema = (
-                    db.query(Schema)
-                    .filter(Schema.name == schema_name, Schema.is_latest)
-                    .first()
-                )
-                if not db_schema:
-                    logger.error(
-                        f'Schema {schema_name} not found in database after generation'
-                    )
-                    return output  # Return output even if we can't store it
-
-                generation = Generation(
-                    schema_id=db_schema.id,
-                    prompt=request.prompt,
-                    output=output,
-                )
-                db.add(generation)
-                db.commit()
-            except Exception as e:
-                logger.error(f'Failed to store generation in database: {e}')
-                db.rollback()
-                return output  # Return output even if we can't store it
-
-            return output
-        except Exception as e:
-            logger.error(f'Generation failed: {e}')
-            raise HTTPException(
-                status_code=500,
-                detail='Failed to generate structured output',
-                headers={'X-Error-Type': 'generation_error'},
-            )
-    except Exception as e:
-        logger.error(f'Database error in generate endpoint: {e}')
+    service: SchemaService = http_request.app.state.schema_service
+    if not (found := await service.get_with_id(schema_name, db)):
         raise HTTPException(
-            status_code=500,
-            detail='Database error occurred',
-            headers={'X-Error-Type': 'database_error'},
+            status_code=404,
+            detail=f'Schema {schema_name} not found',
+            headers={'X-Error-Type': 'not_found'},
         )
+    schema, schema_id = found
+
+    if schema_name == 'NewSchema':
+        # never cached: each call creates a schema as a side effect
+        result = await _cast_new_schema(request.prompt)
+        await service.create(result, db)
+        output = result.model_dump()
+    else:
+        cache_key = (schema_name, schema.version, request.prompt)
+        if (output := _generate_cache.get(cache_key)) is not None:
+            _generate_cache.move_to_end(cache_key)
+        else:
+            model = create_pydantic_model(schema)
+            result = await marvin.cast_async(request.prompt, target=model)
+            output = result.model_dump()
+            _generate_cache[cache_key] = output
+            if len(_generate_cache) > _GENERATE_CACHE_MAX:
+                _generate_cache.popitem(last=False)
+
+    try:
+        # Store the generation against the schema id loaded at the top
+        # of the handler - no second lookup needed
+        generation = Generation(
+            schema_id=schema_id,
+            prompt=request.prompt,
+            output=output,
+        )
+        db.add(generation)
+        await db.commit()
+    except Exception as e:
+        logger.error('Failed to store generation in database: %s', e)
+        await db.rollback()
+        # Return output even if we can't store it
+
+    return output
 
 
 @app.get('/generations/{schema_name}')
-def get_generations(
+async def get_generations(
     schema_name: str,
     favorites_only: bool = False,
-    db: Session = Depends(get_db),
-) -> list[GenerationResponse]:
-    """Get generation history for a schema"""
-    try:
-        # First check if schema exists
-        schema = (
-            db.query(Schema)
-            .filter(Schema.name == schema_name, Schema.is_latest)
-            .first()
+    limit: int | None = Query(default=None, ge=1, le=500),
+    before: int | None = None,
+    db: AsyncSession = Depends(get_db),
+) -> list[dict[str, Any]] | dict[str, Any]:
+    """Get generation history for a schema.
+
+    Passing `limit` switches to a paginated `{'items', 'next_cursor'}`
+    response; `before` (a generation id from a prior `next_cursor`)
+    fetches the next page via a keyset scan instead of OFFSET. Without
+    `limit` the full history is returned as before.
+    """
+    # Get all generations for this schema name, including their schema versions
+    stmt = (
+        select(Generation)
+        .options(
+            selectinload(Generation.schema),
+            undefer(Generation.output),
+            raiseload('*'),
         )
-        if not schema:
+        .join(Schema)
+        .where(Schema.name == schema_name)
+        .order_by(Generation.id.desc())
+    )
+
+    if favorites_only:
+        stmt = stmt.where(Generation.is_favorite)
+    if before is not None:
+        stmt = stmt.where(Generation.id < before)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+
+    generations = (await db.execute(stmt)).scalars().all()
+
+    # only pay for the existence check when there is nothing to return;
+    # a non-empty result already proves the schema exists
+    if not generations:
+        exists = (
+            await db.execute(
+                select(Schema.id).where(
+                    Schema.name == schema_name, Schema.is_latest
+                )
+            )
+        ).first()
+        if not exists:
             raise HTTPException(
                 status_code=404, detail=f'Schema {schema_name} not found'
             )
 
-        # Get all generations for this schema name, including their schema versions
-        query = (
-            db.query(Generation)
-            .join(Schema)
-            .filter(Schema.name == schema_name)
-            .order_by(Generation.id.desc())
-        )
-
-        if favorites_only:
-            query = query.filter(Generation.is_favorite)
-
-        generations = query.all()
-
-        return [
-            GenerationResponse(
-                id=gen.id,
-                schema_name=schema_name,
-                schema_version=gen.schema.version,
-                prompt=gen.prompt,
-                output=gen.output,
-                created_at=gen.created_at.isoformat(),
-                is_favorite=gen.is_favorite,
-            )
-            for gen in generations
-        ]
-    except Exception as e:
-        logger.error(f'Error getting generations: {e}')
-        return []
+    items = [_generation_dict(gen, schema_name) for gen in generations]
+    if limit is None:
+        return items
+    return {
+        'items': items,
+        'next_cursor': (
+            generations[-1].id
+            if generations and len(generations) == limit
+            else None
+        ),
+    }
 
 
 @app.put('/generations/{generation_id}/favorite')
-def toggle_favorite(
+async def toggle_favorite(
     generation_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> GenerationResponse:
     """Toggle favorite status of a generation"""
-    generation = (
-        db.query(Generation).filter(Generation.id == generation_id).first()
+    # PK lookup via the identity map / compiled by-PK statement instead
+    # of compiling a fresh SELECT
+    generation = await db.get(
+        Generation,
+        generation_id,
+        options=[selectinload(Generation.schema), undefer(Generation.output)],
     )
     if not generation:
         raise HTTPException(
@@ -319,9 +530,9 @@ def toggle_favorite(
         )
 
     generation.is_favorite = not generation.is_favorite
-    db.commit()
+    await db.commit()
 
-    return GenerationResponse(
+    return GenerationResponse.model_construct(
         id=generation.id,
         schema_name=generation.schema.name,
         schema_version=generation.schema.version,
@@ -333,14 +544,18 @@ def toggle_favorite(
 
 
 @app.delete('/schemas/{schema_name}')
-def delete_schema(
+async def delete_schema(
     schema_name: str,
-    service: SchemaService = Depends(get_schema_service),
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
 ) -> dict[str, str]:
     """Delete a schema"""
+    service: SchemaService = request.app.state.schema_service
     try:
-        service.delete(schema_name, db)
+        await service.delete(schema_name, db)
+        # evict compiled models for the removed schema; entries are
+        # content-keyed, so a full clear is the only way to drop them
+        _build_model.cache_clear()
         return {'message': f'Schema {schema_name} deleted successfully'}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -350,18 +565,19 @@ def delete_schema(
 async def update_schema(
     schema_name: str,
     request: PromptRequest,
-    service: SchemaService = Depends(get_schema_service),
-    db: Session = Depends(get_db),
+    http_request: Request,
+    db: AsyncSession = Depends(get_db),
 ) -> dict[str, Any]:
     """Update a schema using AI to transform it"""
-    if not (old_schema := service.get(schema_name, db)):
+    service: SchemaService = http_request.app.state.schema_service
+    if not (old_schema := await service.get(schema_name, db)):
         raise HTTPException(
             status_code=404, detail=f'Schema {schema_name} not found'
         )
 
     try:
         logger.info(
-            f'Updating schema {schema_name} with prompt: {request.prompt}'
+            'Updating schema %s with prompt: %s', schema_name, request.prompt
         )
         # Transform the schema but preserve the original name
         updated_schema = await marvin.cast_async(
@@ -371,67 +587,73 @@ async def update_schema(
         )
         updated_schema.name = schema_name  # ensure name stays the same
 
-        # Update schema and create new version
-        service.create(updated_schema, db)
+        # Update schema and create new version; drop the superseded
+        # compiled model so the cache only holds live field sets
+        await service.create(updated_schema, db)
+        _build_model.cache_clear()
         return updated_schema.model_dump()
     except Exception as e:
-        logger.error(f'Schema update failed: {e}')
+        logger.error('Schema update failed: %s', e)
         raise HTTPException(
             status_code=500, detail=f'Failed to update schema: {str(e)}'
         )
 
 
 @app.delete('/generations/{generation_id}')
-def delete_generation(
+async def delete_generation(
     generation_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> dict[str, str]:
     """Delete a generation"""
-    generation = (
-        db.query(Generation).filter(Generation.id == generation_id).first()
-    )
+    generation = await db.get(Generation, generation_id)
     if not generation:
         raise HTTPException(
             status_code=404, detail=f'Generation {generation_id} not found'
         )
 
-    try:
-        db.delete(generation)
-        db.commit()
-        return {'message': f'Generation {generation_id} deleted successfully'}
-    except Exception as e:
-        logger.error(f'Failed to delete generation {generation_id}: {e}')
-        db.rollback()
-        raise HTTPException(
-            status_code=500, detail=f'Failed to delete generation: {str(e)}'
-        )
+    await db.delete(generation)
+    await db.commit()
+    return {'message': f'Generation {generation_id} deleted successfully'}
 
 
 @app.get('/schemas/{schema_name}')
-def get_schema(
+async def get_schema(
     schema_name: str,
-    service: SchemaService = Depends(get_schema_service),
-    db: Session = Depends(get_db),
+    request: Request,
+    db: AsyncSession = Depends(get_db),
 ) -> dict[str, Any]:
     """Get a specific schema by name"""
-    if not (schema := service.get(schema_name, db)):
+    service: SchemaService = request.app.state.schema_service
+    cache_key = (schema_name, service.cache_version)
+    if (cached := _schemas_cache_get(cache_key)) is not None:
+        return cached
+
+    if not (schema := await service.get(schema_name, db)):
         raise HTTPException(
             status_code=404, detail=f'Schema {schema_name} not found'
         )
-    return schema.model_dump()
+    payload = schema.model_dump()
+    _schemas_cache_put(cache_key, payload)
+    return payload
 
 
 @app.get('/schemas/{schema_name}/versions')
-def get_schema_versions(
+async def get_schema_versions(
     schema_name: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ) -> list[dict[str, Any]]:
     """Get version history for a schema"""
     # Get all versions of the schema
     versions = (
-        db.query(Schema)
-        .filter(Schema.name == schema_name)
-        .order_by(Schema.version.desc())
+        (
+            await db.execute(
+                select(Schema)
+                .options(undefer(Schema.fields))
+                .where(Schema.name == schema_name)
+                .order_by(Schema.version.desc())
+            )
+        )
+        .scalars()
         .all()
     )
 
@@ -454,40 +676,77 @@ def get_schema_versions(
     ]
 
 
-@app.get('/generations')
-def get_all_generations(
-    db: Session = Depends(get_db),
-) -> dict[str, list[GenerationResponse]]:
+async def _stream_all_generations(
+    db: AsyncSession,
+) -> AsyncGenerator[bytes, None]:
+    """Yield the grouped generations payload as incremental JSON bytes.
+
+    Rows are fetched in server-side batches (yield_per) ordered by schema
+    name, so memory stays flat and the first bytes go out before the
+    whole history is loaded. joinedload (not selectinload) keeps the
+    many-to-one schema load compatible with yield_per.
+    """
+    stmt = (
+        select(Generation)
+        .options(joinedload(Generation.schema), undefer(Generation.output))
+        .join(Schema)
+        .order_by(Schema.name, Generation.id.desc())
+        .execution_options(yield_per=500)
+    )
+    result = await db.stream(stmt)
+
+    current: str | None = None
+    yield b'{'
+    async for gen in result.scalars():
+        schema_name = gen.schema.name
+        if schema_name != current:
+            if current is not None:
+                yield b'],'
+            yield orjson.dumps(schema_name) + b':['
+            current = schema_name
+        else:
+            yield b','
+        yield orjson.dumps(_generation_dict(gen, schema_name))
+    if current is not None:
+        yield b']'
+    yield b'}'
+
+
+@app.get('/generations', response_model=None)
+async def get_all_generations(
+    stream: bool = False,
+    db: AsyncSession = Depends(get_db),
+) -> StreamingResponse | dict[str, list[dict[str, Any]]]:
     """Get all generations grouped by schema"""
-    try:
-        # Get all generations with their schemas
-        generations = (
-            db.query(Generation)
-            .join(Schema)
-            .order_by(Generation.id.desc())
-            .all()
+    if stream:
+        return StreamingResponse(
+            _stream_all_generations(db), media_type='application/json'
         )
 
-        # Group generations by schema name
-        grouped_generations: dict[str, list[GenerationResponse]] = {}
-        for gen in generations:
-            schema_name = gen.schema.name
-            if schema_name not in grouped_generations:
-                grouped_generations[schema_name] = []
-
-            grouped_generations[schema_name].append(
-                GenerationResponse(
-                    id=gen.id,
-                    schema_name=schema_name,
-                    schema_version=gen.schema.version,
-                    prompt=gen.prompt,
-                    output=gen.output,
-                    created_at=gen.created_at.isoformat(),
-                    is_favorite=gen.is_favorite,
+    # One query ordered by schema name; grouping is then a single
+    # pass over adjacent runs instead of per-row dict bookkeeping.
+    # (json_agg-style SQL grouping is a postgres-ism; SQLite keeps
+    # the ordered-query + groupby fallback.)
+    generations = (
+        (
+            await db.execute(
+                select(Generation)
+                .options(
+                    selectinload(Generation.schema),
+                    undefer(Generation.output),
+                    raiseload('*'),
                 )
+                .join(Schema)
+                .order_by(Schema.name, Generation.id.desc())
             )
+        )
+        .scalars()
+        .all()
+    )
 
-        return grouped_generations
-    except Exception as e:
-        logger.error(f'Error getting all generations: {e}')
-        return {}
+    return {
+        schema_name: [_generation_dict(gen, schema_name) for gen in group]
+        for schema_name, group in groupby(
+            generations, key=lambda gen: gen.schema.name
+        )
+    }
@@ -1,10 +1,16 @@
 """Schema management"""
 
-from pydantic import BaseModel, Field
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
 
-from .database import Schema, get_session, init_db
+from pydantic import BaseModel, ConfigDict, Field
+from sqlalchemy import delete, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .database import Generation, Schema, get_session
 from .loggers import get_logger
 
 logger = get_logger(__name__)
@@ -13,6 +19,10 @@ logger = get_logger(__name__)
 class SchemaField(BaseModel):
     """A field in a schema"""
 
+    # defer_build skips validator/serializer construction at import
+    # (BUILTIN_SCHEMAS instantiates these eagerly) until first use
+    model_config = ConfigDict(defer_build=True)
+
     name: str
     type: str
     description: str
@@ -21,6 +31,8 @@ class SchemaField(BaseModel):
 class SchemaDefinition(BaseModel):
     """A schema definition"""
 
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(..., description='like "Location" or "Person" or "Movie"')
     description: str = Field(
         ..., description='a short description of the schema'
@@ -127,106 +139,167 @@ BUILTIN_SCHEMAS = {
 }
 
 
+# builtin rows are a compile-time constant; serializing them here means
+# startup does no pydantic dump work
+_BUILTIN_ROWS = [
+    {
+        'name': name,
+        'description': schema.description,
+        'prompt': schema.prompt,
+        'fields': [field.model_dump() for field in schema.fields],
+        'is_builtin': True,
+        'version': 1,
+        'is_latest': True,
+    }
+    for name, schema in BUILTIN_SCHEMAS.items()
+]
+
+
 class SchemaService:
     """Schema management service"""
 
     def __init__(self):
         """Initialize service"""
-        self._init_builtins()
+        # bumped on every write so read caches keyed on it invalidate
+        self.cache_version = 0
+        # name -> (definition, row id) for latest versions, loaded
+        # lazily and dropped on every write; schemas are tiny and only
+        # change through create/delete, so reads become dict lookups
+        self._cache: dict[str, tuple[SchemaDefinition, int]] | None = None
+        # read-only view over the cached definitions handed out by
+        # get_all; rebuilt with the cache so no dict is copied per call
+        self._published: Mapping[str, SchemaDefinition] = MappingProxyType({})
 
     def _init_builtins(self):
         """Initialize built-in schemas"""
         session = get_session()
         try:
-            for name, schema in BUILTIN_SCHEMAS.items():
-                # check if schema already exists
-                stored = (
-                    session.query(Schema)
-                    .filter(Schema.name == name, Schema.is_latest)
-                    .first()
-                )
-                if not stored:
-                    stored = Schema(
-                        name=name,
-                        description=schema.description,
-                        prompt=schema.prompt,
-                        fields=[field.model_dump() for field in schema.fields],
-                        is_builtin=True,
-                        version=1,
-                        is_latest=True,
-                    )
-                    try:
-                        session.add(stored)
-                        session.commit()
-                    except Exception as e:
-                        logger.error(f'Failed to initialize {name}: {e}')
-                        session.rollback()
+            # one INSERT .. ON CONFLICT DO NOTHING round trip for every
+            # builtin; the partial unique index on (name) WHERE
+            # is_latest discards rows that already exist, replacing the
+            # per-schema SELECT + INSERT + commit loop. The construct
+            # is dialect-specific, so pick it off the bound engine
+            if session.get_bind().dialect.name == 'postgresql':
+                insert = pg_insert
+            else:
+                insert = sqlite_insert
+            session.execute(
+                insert(Schema)
+                .values(_BUILTIN_ROWS)
+                .on_conflict_do_nothing()
+            )
+            session.commit()
         except Exception as e:
-            logger.error(f'Failed to initialize builtins: {e}')
+            logger.error('Failed to initialize builtins: %s', e)
+            session.rollback()
         finally:
             session.close()
 
-    def get_all(self, session: Session) -> dict[str, SchemaDefinition]:
-        """Get all latest schema versions"""
-        try:
-            stmt = select(Schema).where(Schema.is_latest)
-            results = session.execute(stmt).scalars().all()
-            return {
-                schema.name: SchemaDefinition(
-                    name=schema.name,
-                    description=schema.description,
-                    prompt=schema.prompt,
-                    fields=[SchemaField(**field) for field in schema.fields],
-                    is_builtin=schema.is_builtin,
-                    version=schema.version,
-                )
-                for schema in results
+    @staticmethod
+    def _to_definition(schema: Any) -> SchemaDefinition:
+        """Build a SchemaDefinition from a schemas row (ORM or Core).
+
+        Rows were validated on write, so model_construct skips the
+        redundant pydantic validation pass on every read.
+        """
+        return SchemaDefinition.model_construct(
+            name=schema.name,
+            description=schema.description,
+            prompt=schema.prompt,
+            fields=[
+                SchemaField.model_construct(**field)
+                for field in schema.fields
+            ],
+            is_builtin=schema.is_builtin,
+            version=schema.version,
+        )
+
+    async def _ensure_cache(
+        self, session: AsyncSession
+    ) -> dict[str, tuple[SchemaDefinition, int]]:
+        """Load the latest schema versions into the cache if needed"""
+        if self._cache is None:
+            # Core column select: plain row tuples, no ORM instance
+            # construction or identity-map bookkeeping per row
+            stmt = select(
+                Schema.id,
+                Schema.name,
+                Schema.description,
+                Schema.prompt,
+                Schema.fields,
+                Schema.is_builtin,
+                Schema.version,
+            ).where(Schema.is_latest)
+            results = (await session.execute(stmt)).all()
+            self._cache = {
+                row.name: (self._to_definition(row), row.id)
+                for row in results
             }
+            self._published = MappingProxyType(
+                {name: defn for name, (defn, _) in self._cache.items()}
+            )
+        return self._cache
+
+    async def get_all(
+        self, session: AsyncSession
+    ) -> Mapping[str, SchemaDefinition]:
+        """Get all latest schema versions (read-only view)"""
+        try:
+            await self._ensure_cache(session)
+            return self._published
         except Exception as e:
-            logger.error(f'Failed to get all schemas: {e}')
+            logger.error('Failed to get all schemas: %s', e)
             return {}
 
-    def get(self, name: str, session: Session) -> SchemaDefinition | None:
+    async def get(
+        self, name: str, session: AsyncSession
+    ) -> SchemaDefinition | None:
         """Get latest version of a schema by name"""
+        if found := await self.get_with_id(name, session):
+            return found[0]
+        return None
+
+    async def get_with_id(
+        self, name: str, session: AsyncSession
+    ) -> tuple[SchemaDefinition, int] | None:
+        """Get latest version of a schema along with its row id.
+
+        Callers that need the id for foreign keys (e.g. recording a
+        generation) can reuse this lookup instead of re-querying.
+        """
         try:
-            # Ensure tables exist
-            init_db()
-
-            stmt = select(Schema).where(Schema.name == name, Schema.is_latest)
-            result = session.execute(stmt).scalar_one_or_none()
-            if result:
-                return SchemaDefinition(
-                    name=result.name,
-                    description=result.description,
-                    prompt=result.prompt,
-                    fields=[SchemaField(**field) for field in result.fields],
-                    is_builtin=result.is_builtin,
-                    version=result.version,
-                )
-            return None
+            cache = await self._ensure_cache(session)
+            return cache.get(name)
         except Exception as e:
-            logger.error(f'Failed to get schema {name}: {e}')
+            logger.error('Failed to get schema %s: %s', name, e)
             return None
 
-    def create(self, schema: SchemaDefinition, session: Session) -> None:
+    async def create(
+        self, schema: SchemaDefinition, session: AsyncSession
+    ) -> None:
         """Create or update a schema"""
         try:
-            # Ensure tables exist
-            init_db()
-
-            # get existing latest version
-            existing = session.execute(
-                select(Schema).where(
-                    Schema.name == schema.name, Schema.is_latest
+            # only the columns the new version needs, not the full row
+            # (notably skipping the deferred fields JSON)
+            existing = (
+                await session.execute(
+                    select(
+                        Schema.id, Schema.version, Schema.is_builtin
+                    ).where(Schema.name == schema.name, Schema.is_latest)
                 )
-            ).scalar_one_or_none()
+            ).one_or_none()
 
             # Convert fields to JSON-serializable format
             serialized_fields = [field.model_dump() for field in schema.fields]
 
             if existing:
-                # Mark current version as not latest
-                existing.is_latest = False
+                # Demote the current version first so the partial unique
+                # index on (name) WHERE is_latest accepts the INSERT below
+                await session.execute(
+                    update(Schema)
+                    .where(Schema.id == existing.id)
+                    .values(is_latest=False)
+                )
 
                 # Create new version
                 new_version = Schema(
@@ -253,41 +326,68 @@ class SchemaService:
                 )
                 session.add(new_schema)
 
-            session.commit()
+            await session.commit()
+            self._cache = None
+            self.cache_version += 1
         except Exception as e:
-            logger.error(f'Failed to create/update schema {schema.name}: {e}')
-            session.rollback()
+            logger.error(
+                'Failed to create/update schema %s: %s', schema.name, e
+            )
+            await session.rollback()
             raise
 
-    def delete(self, name: str, session: Session) -> None:
+    async def delete(self, name: str, session: AsyncSession) -> None:
         """Delete all versions of a schema"""
         try:
-            # Ensure tables exist
-            init_db()
-
-            schema = session.execute(
-                select(Schema).where(Schema.name == name, Schema.is_latest)
-            ).scalar_one_or_none()
+            latest = (
+                await session.execute(
+                    select(Schema.is_builtin).where(
+                        Schema.name == name, Schema.is_latest
+                    )
+                )
+            ).one_or_none()
 
-            if schema:
-                if schema.is_builtin:
+            if latest:
+                if latest.is_builtin:
                     raise ValueError(f'Cannot delete built-in schema {name}')
 
-                # Delete all versions of this schema
-                schemas_to_delete = (
-                    session.query(Schema).filter(Schema.name == name).all()
+                # two bulk DELETEs: generations first so databases
+                # migrated before the FK grew ON DELETE CASCADE don't
+                # trip the constraint, then every schema version
+                await session.execute(
+                    delete(Generation)
+                    .where(
+                        Generation.schema_id.in_(
+                            select(Schema.id).where(Schema.name == name)
+                        )
+                    )
+                    .execution_options(synchronize_session=False)
                 )
-                for schema in schemas_to_delete:
-                    session.delete(
-                        schema
-                    )  # This will cascade delete generations due to relationship config
-                session.commit()
+                await session.execute(
+                    delete(Schema)
+                    .where(Schema.name == name)
+                    .execution_options(synchronize_session=False)
+                )
+                await session.commit()
+                self._cache = None
+                self.cache_version += 1
             else:
                 raise ValueError(f'Schema {name} not found')
         except Exception as e:
-            logger.error(f'Failed to delete schema {name}: {e}')
-            session.rollback()
+            logger.error('Failed to delete schema %s: %s', name, e)
+            await session.rollback()
             raise
 
 
-schema_service = SchemaService()
+# constructed lazily so importing this module (Alembic, tooling, tests
+# that only need the types) does no DB work; builtin seeding happens in
+# the app lifespan
+_schema_service: SchemaService | None = None
+
+
+def get_schema_service() -> SchemaService:
+    """Get the shared schema service, creating it on first use"""
+    global _schema_service
+    if _schema_service is None:
+        _schema_service = SchemaService()
+    return _schema_service
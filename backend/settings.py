@@ -1,6 +1,7 @@
 """Settings"""
 
-import importlib
+import functools
+import importlib.util
 from typing import ClassVar, Literal, Self
 
 from pydantic import model_validator
@@ -28,9 +29,9 @@ class Settings(BaseSettings):
     def validate_llm_deps_installed(self) -> Self:
         """Validate that the LLM model is installed"""
         if self.llm_model.startswith('openai:'):
-            try:
-                importlib.import_module('openai')
-            except ImportError:
+            # find_spec checks availability without paying the actual
+            # import; pydantic-ai imports openai when it is first used
+            if importlib.util.find_spec('openai') is None:
                 raise ValueError(
                     f'`uv pip install openai` to use {self.llm_model}'
                 )
@@ -47,4 +48,15 @@ class Settings(BaseSettings):
         return self
 
 
-settings = Settings()
+@functools.cache
+def get_settings() -> Settings:
+    """Get the shared settings, constructing them on first access"""
+    return Settings()
+
+
+def __getattr__(name: str) -> Settings:
+    # keeps the public `settings` name while guaranteeing the model
+    # validators (env parsing, logging setup) run once per process
+    if name == 'settings':
+        return get_settings()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -9,6 +9,17 @@ from typing import Sequence, Union
 
 from alembic import op
 import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# JSONB on Postgres: binary storage skips reparsing on every read and
+# supports containment operators; SQLite and friends keep plain JSON
+JSON_VARIANT = sa.JSON().with_variant(
+    postgresql.JSONB(astext_type=sa.Text()), 'postgresql'
+)
+
+# 64-bit keys for the append-only log so the table never needs a
+# rewriting type migration; SQLite stays INTEGER for rowid autoincrement
+BIGINT_VARIANT = sa.BigInteger().with_variant(sa.Integer(), 'sqlite')
 
 
 # revision identifiers, used by Alembic.
@@ -19,35 +30,144 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    # ### commands auto generated by Alembic - please adjust! ###
-    op.create_table('schemas',
-    sa.Column('id', sa.Integer(), nullable=False),
-    sa.Column('name', sa.String(), nullable=False),
-    sa.Column('description', sa.String(), nullable=False),
-    sa.Column('prompt', sa.String(), nullable=False),
-    sa.Column('fields', sa.JSON(), nullable=False),
-    sa.Column('version', sa.Integer(), nullable=False),
-    sa.Column('is_builtin', sa.Boolean(), nullable=False),
-    sa.Column('created_at', sa.DateTime(), nullable=False),
-    sa.Column('parent_id', sa.Integer(), nullable=True),
-    sa.Column('is_latest', sa.Boolean(), nullable=False),
-    sa.ForeignKeyConstraint(['parent_id'], ['schemas.id'], ),
-    sa.PrimaryKeyConstraint('id')
-    )
-    op.create_table('generations',
-    sa.Column('id', sa.Integer(), nullable=False),
-    sa.Column('schema_id', sa.Integer(), nullable=False),
-    sa.Column('prompt', sa.String(), nullable=False),
-    sa.Column('output', sa.JSON(), nullable=False),
-    sa.Column('created_at', sa.DateTime(), nullable=False),
-    sa.Column('is_favorite', sa.Boolean(), nullable=False),
-    sa.ForeignKeyConstraint(['schema_id'], ['schemas.id'], ),
-    sa.PrimaryKeyConstraint('id')
-    )
-    # ### end Alembic commands ###
+    # autocommit_block lets each DDL statement commit on its own instead
+    # of holding one long migration transaction; it is also required for
+    # CREATE INDEX CONCURRENTLY on Postgres
+    with op.get_context().autocommit_block():
+        # ### commands auto generated by Alembic - please adjust! ###
+        # fixed-width columns lead so variable-width values add no
+        # alignment padding between them (Postgres stores columns in
+        # declared order)
+        op.create_table('schemas',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('parent_id', sa.Integer(), nullable=True),
+        sa.Column('version', sa.SmallInteger(), nullable=False),
+        sa.Column('is_builtin', sa.Boolean(), nullable=False),
+        sa.Column('is_latest', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True),
+                  server_default=sa.text('CURRENT_TIMESTAMP'),
+                  nullable=False),
+        sa.Column('name', sa.Text(), nullable=False),
+        sa.Column('description', sa.Text(), nullable=False),
+        sa.Column('prompt', sa.Text(), nullable=False),
+        sa.Column('fields', JSON_VARIANT, nullable=False),
+        # a declared bound (rather than unbounded text) feeds the
+        # planner's selectivity estimates; length() works on both
+        # Postgres and SQLite
+        sa.CheckConstraint(
+            'length(name) <= 255', name='ck_schemas_name_len'
+        ),
+        sa.ForeignKeyConstraint(['parent_id'], ['schemas.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        op.create_table('generations',
+        sa.Column('id', BIGINT_VARIANT, nullable=False),
+        sa.Column('schema_id', sa.Integer(), nullable=False),
+        sa.Column('is_favorite', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True),
+                  server_default=sa.text('CURRENT_TIMESTAMP'),
+                  nullable=False),
+        sa.Column('prompt', sa.Text(), nullable=False),
+        sa.Column('output', JSON_VARIANT, nullable=False),
+        sa.ForeignKeyConstraint(['schema_id'], ['schemas.id'], ),
+        sa.PrimaryKeyConstraint('id')
+        )
+        # ### end Alembic commands ###
+
+        # mirror the ORM metadata exactly (same names, same shapes) so
+        # a database built from this revision matches create_all and
+        # autogenerate stays quiet
+        op.create_index(
+            'ix_schemas_name_latest',
+            'schemas',
+            ['name', 'is_latest'],
+            postgresql_concurrently=True,
+        )
+        # the database, not the application, enforces one latest row
+        # per name: writers can rely on a single atomic INSERT instead
+        # of a read-then-check round trip
+        op.create_index(
+            'ix_schemas_name_is_latest_unique',
+            'schemas',
+            ['name'],
+            unique=True,
+            postgresql_where=sa.text('is_latest'),
+            sqlite_where=sa.text('is_latest = 1'),
+            postgresql_concurrently=True,
+        )
+        # the self-referential parent_id FK gets no index automatically;
+        # without one, version-chain walks and deletes scan the table
+        op.create_index(
+            'ix_schemas_parent_id',
+            'schemas',
+            ['parent_id'],
+            postgresql_concurrently=True,
+        )
+        # covers the "recent generations for a schema" listing: the
+        # index is already in result order, so no sort node is needed
+        op.create_index(
+            'ix_generations_schema_created',
+            'generations',
+            ['schema_id', sa.text('created_at DESC')],
+            postgresql_concurrently=True,
+        )
+
+        if op.get_bind().dialect.name == 'postgresql':
+            # versioning flips is_latest on existing rows; headroom on
+            # each page keeps those updates HOT (no index maintenance).
+            # generations is append-only and keeps the default
+            op.execute('ALTER TABLE schemas SET (fillfactor = 70)')
+            # JSON payloads compress poorly; EXTERNAL keeps out-of-line
+            # TOAST storage but skips the pglz pass on every write
+            op.execute(
+                'ALTER TABLE schemas '
+                'ALTER COLUMN fields SET STORAGE EXTERNAL'
+            )
+            op.execute(
+                'ALTER TABLE generations '
+                'ALTER COLUMN output SET STORAGE EXTERNAL'
+            )
+            # jsonb_path_ops GIN: smaller than the default opclass and
+            # covers @> containment lookups on the JSONB blobs
+            op.create_index(
+                'ix_schemas_fields_gin',
+                'schemas',
+                ['fields'],
+                postgresql_using='gin',
+                postgresql_ops={'fields': 'jsonb_path_ops'},
+                postgresql_concurrently=True,
+            )
+            op.create_index(
+                'ix_generations_output_gin',
+                'generations',
+                ['output'],
+                postgresql_using='gin',
+                postgresql_ops={'output': 'jsonb_path_ops'},
+                postgresql_concurrently=True,
+            )
+            # BRIN tracks min/max per heap range: tiny (KBs per million
+            # rows) and ideal for the insert-ordered created_at column
+            op.create_index(
+                'ix_generations_created_brin',
+                'generations',
+                ['created_at'],
+                postgresql_using='brin',
+                postgresql_with={'pages_per_range': 32},
+                postgresql_concurrently=True,
+            )
 
 
 def downgrade() -> None:
+    if op.get_bind().dialect.name == 'postgresql':
+        op.drop_index(
+            'ix_generations_created_brin', table_name='generations'
+        )
+        op.drop_index('ix_generations_output_gin', table_name='generations')
+        op.drop_index('ix_schemas_fields_gin', table_name='schemas')
+    op.drop_index('ix_generations_schema_created', table_name='generations')
+    op.drop_index('ix_schemas_parent_id', table_name='schemas')
+    op.drop_index('ix_schemas_name_is_latest_unique', table_name='schemas')
+    op.drop_index('ix_schemas_name_latest', table_name='schemas')
     # ### commands auto generated by Alembic - please adjust! ###
     op.drop_table('generations')
     op.drop_table('schemas')
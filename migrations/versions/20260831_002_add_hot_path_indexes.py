@@ -0,0 +1,58 @@
+"""add hot path indexes
+
+Revision ID: 002
+Create Date: 2026-08-31
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision: str = '002'
+down_revision: str | None = '2d221dd21492'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade the database"""
+    # if_not_exists: fresh databases get these indexes from the initial
+    # revision already; this revision backfills databases created
+    # before it grew them
+    op.create_index(
+        'ix_schemas_name_latest',
+        'schemas',
+        ['name', 'is_latest'],
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_schemas_name_is_latest_unique',
+        'schemas',
+        ['name'],
+        unique=True,
+        sqlite_where=sa.text('is_latest = 1'),
+        postgresql_where=sa.text('is_latest'),
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_generations_schema_created',
+        'generations',
+        ['schema_id', sa.text('created_at DESC')],
+        if_not_exists=True,
+    )
+    op.create_index(
+        'ix_schemas_parent_id',
+        'schemas',
+        ['parent_id'],
+        if_not_exists=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade the database"""
+    op.drop_index('ix_schemas_parent_id', 'schemas')
+    op.drop_index('ix_generations_schema_created', 'generations')
+    op.drop_index('ix_schemas_name_is_latest_unique', 'schemas')
+    op.drop_index('ix_schemas_name_latest', 'schemas')
@@ -0,0 +1,42 @@
+"""bound name and index versions
+
+Revision ID: 003
+Create Date: 2026-08-31
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision: str = '003'
+down_revision: str | None = '002'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade the database"""
+    with op.batch_alter_table('schemas') as batch_op:
+        batch_op.alter_column(
+            'name',
+            existing_type=sa.String(),
+            type_=sa.String(255),
+            existing_nullable=False,
+        )
+    op.create_index(
+        'ix_schemas_name_version', 'schemas', ['name', 'version']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade the database"""
+    op.drop_index('ix_schemas_name_version', 'schemas')
+    with op.batch_alter_table('schemas') as batch_op:
+        batch_op.alter_column(
+            'name',
+            existing_type=sa.String(255),
+            type_=sa.String(),
+            existing_nullable=False,
+        )
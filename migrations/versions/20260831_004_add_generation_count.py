@@ -0,0 +1,40 @@
+"""add generation count
+
+Revision ID: 004
+Create Date: 2026-08-31
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision: str = '004'
+down_revision: str | None = '003'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade the database"""
+    op.add_column(
+        'schemas',
+        sa.Column(
+            'generation_count',
+            sa.Integer(),
+            nullable=False,
+            server_default='0',
+        ),
+    )
+    # backfill from existing rows
+    op.execute(
+        'UPDATE schemas SET generation_count = ('
+        'SELECT COUNT(*) FROM generations '
+        'WHERE generations.schema_id = schemas.id)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade the database"""
+    op.drop_column('schemas', 'generation_count')
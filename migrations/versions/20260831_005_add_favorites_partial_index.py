@@ -0,0 +1,34 @@
+"""add favorites partial index
+
+Revision ID: 005
+Create Date: 2026-08-31
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers
+revision: str = '005'
+down_revision: str | None = '004'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade the database"""
+    # (schema_id, created_at DESC) and (name, version) were added in
+    # earlier revisions; this covers the favorites_only listing path
+    op.create_index(
+        'ix_generations_favorite',
+        'generations',
+        ['schema_id', 'created_at'],
+        sqlite_where=sa.text('is_favorite = 1'),
+        postgresql_where=sa.text('is_favorite'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade the database"""
+    op.drop_index('ix_generations_favorite', 'generations')
@@ -0,0 +1,79 @@
+"""cascade foreign keys
+
+Revision ID: 006
+Create Date: 2026-08-31
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers
+revision: str = '006'
+down_revision: str | None = '005'
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# SQLite constraints are unnamed; a naming convention lets batch mode
+# address them during the table rebuild
+NAMING = {
+    'fk': 'fk_%(table_name)s_%(column_0_name)s_%(referred_table_name)s'
+}
+
+
+def upgrade() -> None:
+    """Upgrade the database"""
+    with op.batch_alter_table(
+        'generations', naming_convention=NAMING
+    ) as batch_op:
+        batch_op.drop_constraint(
+            'fk_generations_schema_id_schemas', type_='foreignkey'
+        )
+        batch_op.create_foreign_key(
+            'fk_generations_schema_id_schemas',
+            'schemas',
+            ['schema_id'],
+            ['id'],
+            ondelete='CASCADE',
+        )
+    with op.batch_alter_table(
+        'schemas', naming_convention=NAMING
+    ) as batch_op:
+        batch_op.drop_constraint(
+            'fk_schemas_parent_id_schemas', type_='foreignkey'
+        )
+        batch_op.create_foreign_key(
+            'fk_schemas_parent_id_schemas',
+            'schemas',
+            ['parent_id'],
+            ['id'],
+            ondelete='CASCADE',
+        )
+
+
+def downgrade() -> None:
+    """Downgrade the database"""
+    with op.batch_alter_table(
+        'schemas', naming_convention=NAMING
+    ) as batch_op:
+        batch_op.drop_constraint(
+            'fk_schemas_parent_id_schemas', type_='foreignkey'
+        )
+        batch_op.create_foreign_key(
+            'fk_schemas_parent_id_schemas',
+            'schemas',
+            ['parent_id'],
+            ['id'],
+        )
+    with op.batch_alter_table(
+        'generations', naming_convention=NAMING
+    ) as batch_op:
+        batch_op.drop_constraint(
+            'fk_generations_schema_id_schemas', type_='foreignkey'
+        )
+        batch_op.create_foreign_key(
+            'fk_generations_schema_id_schemas',
+            'schemas',
+            ['schema_id'],
+            ['id'],
+        )